@@ -1,4 +1,6 @@
 from enum import StrEnum
+from functools import cache, cached_property
+from typing import Any
 
 from pydantic import Field, SecretStr, computed_field
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -20,6 +22,8 @@ class MinIOSettings(BaseSettings):
     access_key: str = Field(default="minioadmin")
     secret_key: SecretStr = Field(default=SecretStr("minioadmin"))
     bucket_name: str = Field(default="raw")
+    # Multipart part size for streamed Parquet uploads (S3 allows 5 MiB – 5 GiB)
+    part_size_mb: int = Field(default=6, ge=5, le=5120)
 
 
 class PostgresSettings(BaseSettings):
@@ -37,9 +41,9 @@ class PostgresSettings(BaseSettings):
     silver_neighbourhoods_table: str = Field(default="neighbourhoods")
 
     @computed_field
-    @property
+    @cached_property
     def dsn(self) -> str:
-        """Return the PostgreSQL DSN connection string."""
+        """Return the PostgreSQL DSN connection string (built once, on first access)."""
         return (
             f"postgresql://{self.user}:"
             f"{self.password.get_secret_value()}@"
@@ -68,6 +72,9 @@ class ScraperSettings(BaseSettings):
         )
     )
     download_delay: float = Field(default=2.0, ge=0)
+    max_concurrency: int = Field(default=4, ge=1)
+    # Listing detail pages fetched in parallel within each search page
+    detail_concurrency: int = Field(default=2, ge=1)
 
 
 class Settings(BaseSettings):
@@ -87,4 +94,18 @@ class Settings(BaseSettings):
     dbt: DbtSettings = Field(default_factory=DbtSettings)
 
 
-settings = Settings()
+@cache
+def get_settings() -> Settings:
+    """Return the application settings, loading them on first call.
+
+    Environment variables and the ``.env`` file are read once and the result is
+    shared for the rest of the process.
+    """
+    return Settings()
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve the legacy ``settings`` module attribute lazily."""
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -4,8 +4,8 @@ from datetime import date
 
 from prefect import flow, get_run_logger
 
-from real_estate_data_platform.config.settings import Environment, settings
-from real_estate_data_platform.connectors.minio import MinIOStorage
+from real_estate_data_platform.config.settings import Environment, get_settings
+from real_estate_data_platform.connectors.minio import get_storage
 from real_estate_data_platform.connectors.postgres import PostgresStorage
 from real_estate_data_platform.models.enums import City, DataSource, DateMode, FlowStatus
 from real_estate_data_platform.models.responses import BronzeToSilverResult, PartitionResult
@@ -36,18 +36,20 @@ def process_partition(
     This isolation allows for better error handling and observability at the partition level.
     """
     logger = get_run_logger()
+    settings = get_settings()
     logger.info("Processing partition: %s/%s/%s", source, city, partition_date)
 
     partition = {"source": source, "city": city, "partition_date": partition_date}
 
     # Initialise connectors
     try:
-        minio_storage = MinIOStorage(
+        minio_storage = get_storage(
             endpoint=settings.minio.endpoint,
             access_key=settings.minio.access_key,
             secret_key=settings.minio.secret_key.get_secret_value(),
             bucket_name=settings.minio.bucket_name,
             secure=(settings.environment == Environment.PROD),
+            part_size=settings.minio.part_size_mb * 1024 * 1024,
         )
 
         pg_cfg = settings.postgres
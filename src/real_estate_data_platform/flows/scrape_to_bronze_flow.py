@@ -3,9 +3,11 @@
 from datetime import UTC, date, datetime
 
 from prefect import flow, get_run_logger
+from prefect.futures import as_completed
+from prefect.task_runners import ThreadPoolTaskRunner
 
-from real_estate_data_platform.config.settings import Environment, settings
-from real_estate_data_platform.connectors.minio import MinIOStorage
+from real_estate_data_platform.config.settings import Environment, get_settings
+from real_estate_data_platform.connectors.minio import get_storage
 from real_estate_data_platform.models.enums import City, DateMode, FlowStatus
 from real_estate_data_platform.models.responses import ScrapeToBronzeResult
 from real_estate_data_platform.scrapers.scraper_type import ScraperType
@@ -36,7 +38,7 @@ def scrape_to_bronze(
 
     This flow:
     1. Instantiates the specified scraper type
-    2. Fetches multiple pages
+    2. Fetches multiple pages concurrently (up to ``settings.scraper.max_concurrency``)
     3. Aggregates results
     4. Saves to MinIO in partitioned Parquet format
 
@@ -52,6 +54,7 @@ def scrape_to_bronze(
         ScrapeToBronzeResult with scraping metadata
     """
     logger = get_run_logger()
+    settings = get_settings()
 
     # Validate parameters
     if mode == DateMode.SPECIFIC_DATE and not specific_date:
@@ -79,6 +82,10 @@ def scrape_to_bronze(
         scraper_mode=mode,
         days=days,
         specific_date=specific_date,
+        # Every page task can hold detail_concurrency connections at once
+        pool_maxsize=settings.scraper.max_concurrency * settings.scraper.detail_concurrency,
+        detail_concurrency=settings.scraper.detail_concurrency,
+        scraped_at=scrape_date,
     ) as scraper:
         # Validate if city is supported by scraper
         if city not in scraper.supported_cities:
@@ -89,14 +96,28 @@ def scrape_to_bronze(
                 error=error_msg,
             )
 
-        # TODO: Implement parallel page fetching using map_over in Prefect flow
+        # Fetch pages concurrently; each page is an independent task run with its own retries
         page_results = []
-        for page in range(1, max_pages + 1):
-            try:
-                result = fetch_and_parse_page(scraper=scraper, city=city, page=page)
+        with ThreadPoolTaskRunner(max_workers=settings.scraper.max_concurrency) as runner:
+            futures = {
+                runner.submit(
+                    fetch_and_parse_page,
+                    parameters={"scraper": scraper, "city": city, "page": page},
+                ): page
+                for page in range(1, max_pages + 1)
+            }
+            # Collect pages as they finish so failures are reported immediately
+            for future in as_completed(futures):
+                try:
+                    result = future.result()
+                except Exception:
+                    logger.error("Page %d failed after all retries", futures[future], exc_info=True)
+                    continue
+                # A page replayed from the cache skipped the scraper's URL claims; claim its
+                # listings so pages still being fetched do not request them again
+                scraper.claim_urls(listing.url for listing in result.listings)
                 page_results.append(result)
-            except Exception:
-                logger.error("Page %d failed after all retries", page, exc_info=True)
+        page_results.sort(key=lambda result: result.page_number)
 
     # Aggregate results from all pages
     all_listings, failed_listings = aggregate_results(page_results)
@@ -114,12 +135,13 @@ def scrape_to_bronze(
     # Convert to DataFrame and save to MinIO (raw bucket)
     try:
         df = listings_to_dataframe(all_listings)
-        storage = MinIOStorage(
+        storage = get_storage(
             endpoint=settings.minio.endpoint,
             access_key=settings.minio.access_key,
             secret_key=settings.minio.secret_key.get_secret_value(),
             bucket_name=settings.minio.bucket_name,
             secure=(settings.environment == Environment.PROD),
+            part_size=settings.minio.part_size_mb * 1024 * 1024,
         )
         storage_result = save_listings_to_minio(
             df=df,
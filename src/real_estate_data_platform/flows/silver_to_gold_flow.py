@@ -2,7 +2,7 @@
 
 from prefect import flow, get_run_logger
 
-from real_estate_data_platform.config.settings import settings
+from real_estate_data_platform.config.settings import get_settings
 from real_estate_data_platform.models.enums import FlowStatus
 from real_estate_data_platform.models.responses import SilverToGoldResult
 from real_estate_data_platform.tasks.run_dbt import run_dbt
@@ -28,6 +28,7 @@ def silver_to_gold() -> SilverToGoldResult:
         SilverToGoldResult with execution status.
     """
     logger = get_run_logger()
+    settings = get_settings()
     dbt_cfg = settings.dbt
     target = settings.environment.value
 
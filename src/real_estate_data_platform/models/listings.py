@@ -12,7 +12,8 @@ class RentalsListing(BaseModel):
 
     # Core identification
     listing_id: str = Field(description="Native listing ID from the source site")
-    url: str
+    # Checked by pydantic-core's regex engine rather than a Python-level validator
+    url: str = Field(pattern=r"^https?://")
     website: str = Field(description="Source website (e.g., 'kijiji')")
     published_at: datetime = Field(description="Original publish date from the listing")
     title: str
@@ -93,14 +94,6 @@ class RentalsListing(BaseModel):
     # Metadata
     scraped_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
 
-    @field_validator("url")
-    @classmethod
-    def validate_url(cls, v: str) -> str:
-        """Validate URL format."""
-        if not v.startswith(("http://", "https://")):
-            raise ValueError("URL must start with http:// or https://")
-        return v
-
     @field_validator("published_at")
     @classmethod
     def validate_published_date(cls, v: datetime) -> datetime:
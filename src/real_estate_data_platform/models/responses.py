@@ -3,20 +3,25 @@
 from datetime import date, datetime
 from typing import Self
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from real_estate_data_platform.models.enums import DateMode, FlowStatus
 from real_estate_data_platform.models.listings import RentalsListing
 
 
 class _BaseResult(BaseModel):
-    """Base model for operation results."""
+    """Base model for operation results.
 
-    model_config = {"use_enum_values": True}
+    Results are immutable records of what happened, so they are frozen. Enum fields
+    keep their ``StrEnum`` members: they already compare, format and serialise as their
+    string values, so no ``use_enum_values`` conversion is needed.
+    """
+
+    model_config = ConfigDict(frozen=True)
 
 
 class ScrapeMetadata(_BaseResult):
-    """Metadata about a scrape-to-bronze run, stored as JSON alongside the Parquet file."""
+    """Metadata about a scrape-to-bronze run, stored as JSON in the Parquet file footer."""
 
     mode: DateMode
     days: int
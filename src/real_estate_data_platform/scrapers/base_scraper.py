@@ -1,26 +1,73 @@
 """Base scraper class defining the interface for all scrapers."""
 
 import logging
+import random
+import threading
+import time
 from abc import ABC, abstractmethod
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, date, datetime, timedelta
-from typing import Self
+from typing import ClassVar, Self
 
 import requests
 from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from real_estate_data_platform.models.enums import City, DateMode
 from real_estate_data_platform.models.listings import RentalsListing
 
 logger = logging.getLogger(__name__)
 
+# Transient HTTP failures are retried inside the session with exponential backoff
+# (honouring Retry-After), so a flaky page costs a few sleeps rather than a task rerun.
+# raise_on_status=False hands the last response back so raise_for_status() still
+# surfaces a plain requests.HTTPError once the budget is spent.
+_HTTP_RETRY = Retry(
+    total=5,
+    backoff_factor=0.5,
+    backoff_jitter=0.25,
+    status_forcelist=(429, 500, 502, 503, 504),
+    allowed_methods=("GET",),
+    raise_on_status=False,
+)
+
 
 class BaseScraper(ABC):
     """Abstract base class for all web scrapers.
 
     Implements the Template Method pattern for consistent parsing and date filtering
     across all scraper implementations.
+
+    Subclasses declare the site constants as plain class attributes; a subclass that
+    leaves one out is rejected when it is defined.
     """
 
+    # Name of the scraper (e.g: 'kijiji')
+    name_website: ClassVar[str]
+    # URL of the website (e.g: 'https://www.kijiji.ca')
+    base_url: ClassVar[str]
+    # Mapping of City enum values to web-specific slugs/IDs
+    supported_cities: ClassVar[dict[City, str]]
+
+    _REQUIRED_CLASS_ATTRIBUTES: ClassVar[tuple[str, ...]] = (
+        "name_website",
+        "base_url",
+        "supported_cities",
+    )
+
+    def __init_subclass__(cls, **kwargs: object) -> None:
+        """Reject subclasses that do not define every site constant.
+
+        Raises:
+            TypeError: If a required class attribute is missing
+        """
+        super().__init_subclass__(**kwargs)
+        missing = [name for name in cls._REQUIRED_CLASS_ATTRIBUTES if not hasattr(cls, name)]
+        if missing:
+            raise TypeError(f"{cls.__name__} must define class attributes: {', '.join(missing)}")
+
     def __init__(
         self,
         user_agent: str,
@@ -28,6 +75,9 @@ class BaseScraper(ABC):
         scraper_mode: DateMode = DateMode.LAST_X_DAYS,
         days: int = 7,
         specific_date: date | None = None,
+        pool_maxsize: int = 10,
+        detail_concurrency: int = 1,
+        scraped_at: datetime | None = None,
     ):
         """Initialize scraper.
 
@@ -37,29 +87,35 @@ class BaseScraper(ABC):
             scraper_mode: Mode for date filtering (last_x_days or specific_date)
             days: Number of days for last_x_days mode
             specific_date: Specific date for specific_date mode
+            pool_maxsize: Keep-alive connections kept per host; size it to the number
+                of threads sharing the scraper so no connection is discarded
+            detail_concurrency: Listing detail pages fetched in parallel per search page.
+                Detail fetches of all pages share one pool of ``pool_maxsize`` threads
+            scraped_at: Timestamp stamped on every listing. Default: construction time
         """
         self.user_agent = user_agent
         self.download_delay = download_delay
         self.scraper_mode = scraper_mode
         self.days = days
         self.specific_date = specific_date
+        self.detail_concurrency = detail_concurrency
+        # One scrape timestamp shared by every listing this scraper produces
+        self.scraped_at = scraped_at or datetime.now(UTC)
         self.session = requests.Session()
         self.session.headers.update({"User-Agent": self.user_agent})
-
-    @property
-    @abstractmethod
-    def name_website(self) -> str:
-        """Name of the scraper (e.g: 'kijiji')."""
-
-    @property
-    @abstractmethod
-    def base_url(self) -> str:
-        """URL of the website (e.g: 'https://www.kijiji.ca')."""
-
-    @property
-    @abstractmethod
-    def supported_cities(self) -> dict[City, str]:
-        """Mapping of City enum values to web-specific slugs/IDs."""
+        adapter = HTTPAdapter(pool_maxsize=pool_maxsize, max_retries=_HTTP_RETRY)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        # Created once so its threads (and their connections) outlive a single page;
+        # threads are only started as fetches are submitted
+        self._detail_executor = ThreadPoolExecutor(
+            max_workers=pool_maxsize, thread_name_prefix=f"{self.name_website}-detail"
+        )
+        self._seen_urls: set[str] = set()
+        self._seen_urls_lock = threading.Lock()
+        # Monotonic time before which the next request (from any thread) must not start
+        self._next_request_at = 0.0
+        self._request_lock = threading.Lock()
 
     @abstractmethod
     def get_page(self, city: City, page: int = 1) -> BeautifulSoup:
@@ -129,22 +185,34 @@ class BaseScraper(ABC):
         filtered_listings = self._apply_date_filter(raw_listings, city.value)
         return filtered_listings, failed_count
 
-    def _passes_date_filter(self, listing: RentalsListing) -> bool:
-        """Check if a listing passes the date filter based on scraper mode."""
+    def _date_bounds(self) -> tuple[datetime, datetime] | None:
+        """Inclusive ``published_at`` window for the scraper mode.
+
+        Returns:
+            (start, end) datetimes, or None when no date filter applies
+        """
         match self.scraper_mode:
             case DateMode.LAST_X_DAYS:
                 cutoff = datetime.now(UTC) - timedelta(days=self.days)
-                return listing.published_at >= cutoff
+                return cutoff, datetime.max.replace(tzinfo=UTC)
             case DateMode.SPECIFIC_DATE if self.specific_date:
                 start = datetime.combine(self.specific_date, datetime.min.time(), tzinfo=UTC)
                 end = datetime.combine(self.specific_date, datetime.max.time(), tzinfo=UTC)
-                return start <= listing.published_at <= end
+                return start, end
             case _:
-                return True
+                return None
+
+    def _passes_date_filter(self, listing: RentalsListing) -> bool:
+        """Check if a listing passes the date filter based on scraper mode."""
+        bounds = self._date_bounds()
+        return bounds is None or bounds[0] <= listing.published_at <= bounds[1]
 
     def _apply_date_filter(self, listings: list[RentalsListing], city: str) -> list[RentalsListing]:
         """Apply date filter to listings and log results.
 
+        The date window is resolved once per page, so each listing costs a single
+        chained comparison.
+
         Args:
             listings: List of listings to filter
             city: City name for logging
@@ -152,11 +220,14 @@ class BaseScraper(ABC):
         Returns:
             Filtered list of listings
         """
-        # TODO: Optimize date filtering to stop scraping once a listing date
-        # is found to be older than the target date.
-        # Note: Featured listings appear first and may have significantly different
-        # dates, so early exit logic needs to account for this behavior.
-        filtered_listings = [listing for listing in listings if self._passes_date_filter(listing)]
+        bounds = self._date_bounds()
+        if bounds is None:
+            return listings
+
+        start, end = bounds
+        filtered_listings = [
+            listing for listing in listings if start <= listing.published_at <= end
+        ]
         filtered_count = len(listings) - len(filtered_listings)
 
         if filtered_count > 0:
@@ -164,8 +235,70 @@ class BaseScraper(ABC):
 
         return filtered_listings
 
+    def _wait_for_request_slot(self) -> None:
+        """Throttle all threads sharing the scraper to one request per jittered delay.
+
+        The next start time is reserved under a lock and slept outside it, so request
+        starts are spaced ``download_delay`` apart (on average) across every worker while
+        the responses of in-flight requests still overlap. Time already spent since the
+        previous request is not slept again.
+        """
+        if self.download_delay <= 0:
+            return
+        with self._request_lock:
+            now = time.monotonic()
+            start_at = max(now, self._next_request_at)
+            self._next_request_at = start_at + self.download_delay * random.uniform(0.5, 1.5)
+        if start_at > now:
+            time.sleep(start_at - now)
+
+    def _claim_url(self, url: str) -> bool:
+        """Claim a listing URL for fetching during this scraper's lifetime.
+
+        Pages are fetched concurrently and listings shift between pages while a run is
+        in progress, so the same listing can show up on two pages. Only the first claim
+        should fetch and parse it. Claims on listings that were not parsed must be given
+        back with ``_release_url``.
+
+        Args:
+            url: Listing detail URL
+
+        Returns:
+            True if the URL had not been claimed before, False for a duplicate
+        """
+        with self._seen_urls_lock:
+            if url in self._seen_urls:
+                return False
+            self._seen_urls.add(url)
+            return True
+
+    def claim_urls(self, urls: Iterable[str]) -> None:
+        """Claim the URLs of listings obtained without this scraper fetching them.
+
+        Pages replayed from the task cache never reach ``_parse_page_impl``, so their
+        listings are claimed here to stop fresh pages of the same run fetching them again.
+
+        Args:
+            urls: Listing detail URLs
+        """
+        with self._seen_urls_lock:
+            self._seen_urls.update(urls)
+
+    def _release_url(self, url: str) -> None:
+        """Give back a claim from ``_claim_url`` for a listing that was not parsed.
+
+        Used when a detail fetch fails or is skipped, so another page or a retry of the
+        same page can still fetch the listing.
+
+        Args:
+            url: Listing detail URL
+        """
+        with self._seen_urls_lock:
+            self._seen_urls.discard(url)
+
     def close(self) -> None:
-        """Close any resources (sessions, connections, etc.)."""
+        """Close any resources (sessions, connections, worker threads, etc.)."""
+        self._detail_executor.shutdown()
         self.session.close()
 
     def __enter__(self) -> Self:
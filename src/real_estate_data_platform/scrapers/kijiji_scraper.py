@@ -1,12 +1,13 @@
 """Web scraper for Kijiji.ca listings."""
 
-import json
 import logging
-import random
-from time import sleep
+import re
+from functools import partial
+from typing import ClassVar
 
+import orjson
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 from pydantic import ValidationError
 
 from real_estate_data_platform.models.enums import City
@@ -57,28 +58,41 @@ ATTRIBUTE_MAPPING = {
     "Move-In Date": "move_in_date",
 }
 
+# Everything Kijiji search pages are scraped for lives in their JSON-LD <script>, so only
+# script tags are built into the parse tree.
+_SCRIPT_TAGS = SoupStrainer("script")
+
+# Detail pages only need the Next.js payload; a regex scan avoids building any tree.
+_NEXT_DATA_RE = re.compile(r'<script[^>]*\bid="__NEXT_DATA__"[^>]*>(.*?)</script>', re.DOTALL)
+
 # Fields extracted separately in _parse_listing_detail (not passed via **attributes).
 _SEPARATELY_HANDLED_FIELDS: frozenset[str] = frozenset({"bedrooms", "bathrooms", "size_sqft"})
 
+# Organic results are newest-first: once this many listings in a row predate the date
+# window, the rest of the page is older still and its detail pages are not fetched.
+_OLD_LISTING_STREAK_LIMIT = 3
 
-class KijijiScraper(BaseScraper):
-    """Scraper for Kijiji.ca rental listings."""
+# Mapped attribute fields passed straight through to RentalsListing, resolved once.
+_PASSTHROUGH_FIELDS: tuple[str, ...] = tuple(
+    field for field in ATTRIBUTE_MAPPING.values() if field not in _SEPARATELY_HANDLED_FIELDS
+)
 
-    @property
-    def name_website(self) -> str:
-        return "kijiji"
 
-    @property
-    def base_url(self) -> str:
-        return "https://www.kijiji.ca/b-apartments-condos"
+def _item_url(item: dict) -> str | None:
+    """Detail URL of a search page itemListElement entry, if any."""
+    return item.get("item", {}).get("url")
+
+
+class KijijiScraper(BaseScraper):
+    """Scraper for Kijiji.ca rental listings."""
 
-    @property
-    def supported_cities(self) -> dict[City, str]:
-        return {
-            City.TORONTO: "city-of-toronto/c37l1700273",
-            City.VANCOUVER: "vancouver/c37l1700287",
-            City.LONDON: "london/c37l1700214",
-        }
+    name_website: ClassVar[str] = "kijiji"
+    base_url: ClassVar[str] = "https://www.kijiji.ca/b-apartments-condos"
+    supported_cities: ClassVar[dict[City, str]] = {
+        City.TORONTO: "city-of-toronto/c37l1700273",
+        City.VANCOUVER: "vancouver/c37l1700287",
+        City.LONDON: "london/c37l1700214",
+    }
 
     def get_page(self, city: City, page: int = 1) -> BeautifulSoup:
         """Fetch and parse a search results page from Kijiji.
@@ -88,7 +102,7 @@ class KijijiScraper(BaseScraper):
             page: Page number
 
         Returns:
-            BeautifulSoup object of the page
+            BeautifulSoup object holding the page's ``<script>`` tags
 
         Raises:
             requests.HTTPError: If HTTP request fails
@@ -100,11 +114,12 @@ class KijijiScraper(BaseScraper):
             city_path = f"{parts[0]}/page-{page}/{parts[1]}"
         url = f"{self.base_url}/{city_path}"
 
+        self._wait_for_request_slot()
         logger.info("Fetching %s (page %d)", url, page)
         response = self.session.get(url, timeout=10)
         response.raise_for_status()
 
-        return BeautifulSoup(response.text, "html.parser")
+        return BeautifulSoup(response.text, "html.parser", parse_only=_SCRIPT_TAGS)
 
     def _parse_listing(self, listing_elem: dict, city: City) -> RentalsListing | None:
         """Parse a single listing element from search results.
@@ -117,7 +132,7 @@ class KijijiScraper(BaseScraper):
             RentalsListing object or None if parsing fails
         """
         try:
-            url = listing_elem.get("item", {}).get("url")
+            url = _item_url(listing_elem)
             return self._parse_listing_detail(url, city) if url else None
         except Exception:
             logger.exception("Error parsing search listing")
@@ -155,19 +170,88 @@ class KijijiScraper(BaseScraper):
                 len(items),
             )
 
+            pending = []
             for item in items:
-                listing = self._parse_listing(item, city)
-                if listing:
-                    listings.append(listing)
-                else:
-                    failed_count += 1
-                if self.download_delay > 0:
-                    sleep(self.download_delay * random.uniform(0.5, 1.5))
+                url = _item_url(item)
+                if url and not self._claim_url(url):
+                    continue
+                pending.append(item)
+            if len(pending) < len(items):
+                logger.info(
+                    "Skipped %d listings already fetched in this run", len(items) - len(pending)
+                )
+
+            listings, failed_count = self._fetch_listing_details(pending, city)
         except Exception:
             logger.exception("Error parsing search page for %s", city.value)
 
         return listings, failed_count
 
+    def _fetch_listing_details(
+        self, items: list[dict], city: City
+    ) -> tuple[list[RentalsListing], int]:
+        """Fetch and parse the detail pages of a search page's organic items.
+
+        Detail pages are fetched ``detail_concurrency`` at a time, in page order, on the
+        scraper's shared detail pool; every fetch waits for the shared request slot. Organic
+        results are newest-first, so once ``_OLD_LISTING_STREAK_LIMIT`` listings in a row
+        predate the date window the remaining items are not fetched. Items that fail or
+        are not fetched give their URL claim back, so a retry of the page fetches them.
+
+        Args:
+            items: itemListElement entries still to fetch
+            city: City being scraped
+
+        Returns:
+            Tuple of (parsed listings, number of failed listings)
+        """
+        listings: list[RentalsListing] = []
+        failed_count = 0
+        bounds = self._date_bounds()
+        oldest_allowed = bounds[0] if bounds else None
+        old_streak = 0
+        batch_size = self.detail_concurrency
+        parse = partial(self._parse_listing, city=city)
+
+        done = 0
+
+        try:
+            for start in range(0, len(items), batch_size):
+                batch = items[start : start + batch_size]
+                for item, listing in zip(
+                    batch, self._detail_executor.map(parse, batch), strict=True
+                ):
+                    done += 1
+                    if not listing:
+                        failed_count += 1
+                        self._release_item(item)
+                        continue
+                    listings.append(listing)
+                    if oldest_allowed is not None:
+                        is_old = listing.published_at < oldest_allowed
+                        old_streak = old_streak + 1 if is_old else 0
+                if old_streak >= _OLD_LISTING_STREAK_LIMIT:
+                    logger.info(
+                        "Stopping early after %d consecutive listings older than %s "
+                        "(%d detail pages skipped)",
+                        old_streak,
+                        oldest_allowed,
+                        len(items) - done,
+                    )
+                    break
+        finally:
+            # Items never fetched (early exit or an error) stay available to a retry
+            for item in items[done:]:
+                self._release_item(item)
+
+        return listings, failed_count
+
+    def _release_item(self, item: dict) -> None:
+        """Release the URL claim of an item whose listing was not parsed."""
+        url = _item_url(item)
+        if url:
+            self._release_url(url)
+
     def _parse_listing_detail(self, url: str, city: City) -> RentalsListing | None:
         """Parse a single listing detail page.
 
@@ -179,18 +263,18 @@ class KijijiScraper(BaseScraper):
             RentalsListing object or None if parsing fails
         """
         try:
+            self._wait_for_request_slot()
             logger.info("Fetching listing: %s", url)
             response = self.session.get(url, timeout=10)
             response.raise_for_status()
 
-            soup = BeautifulSoup(response.text, "html.parser")
-            script = soup.find("script", id="__NEXT_DATA__")
+            match = _NEXT_DATA_RE.search(response.text)
 
-            if not script or not script.string:
+            if not match or not match.group(1):
                 logger.warning("No __NEXT_DATA__ script found for %s", url)
                 return None
 
-            data = json.loads(script.string)
+            data = orjson.loads(match.group(1))
             page_props = data.get("props", {}).get("pageProps", {})
             listing_id = page_props.get("listingId")
 
@@ -211,8 +295,12 @@ class KijijiScraper(BaseScraper):
             # Extract neighbourhood and scores
             neighbourhood, scores = self._extract_neighbourhood_info(listing_data, apollo_state)
 
+            # Nested objects used by several fields, looked up once
+            location = listing_data.get("location") or {}
+            coordinates = location.get("coordinates") or {}
+
             # Extract price
-            price = listing_data.get("price", {}).get("amount", 0)
+            price = (listing_data.get("price") or {}).get("amount", 0)
             if isinstance(price, int | float) and price > 100:
                 price = price / 100
 
@@ -227,29 +315,26 @@ class KijijiScraper(BaseScraper):
                 published_at=published_at,
                 title=listing_data.get("title"),
                 description=listing_data.get("description"),
-                street=listing_data.get("location", {}).get("address"),
+                street=location.get("address"),
                 city=city,
                 neighbourhood=neighbourhood,
                 rent=price,
                 bedrooms=parse_int(attributes.get("bedrooms")),
                 bathrooms=parse_int(attributes.get("bathrooms")),
                 size_sqft=parse_float(attributes.get("size_sqft")),
-                latitude=listing_data.get("location", {}).get("coordinates", {}).get("latitude"),
-                longitude=listing_data.get("location", {}).get("coordinates", {}).get("longitude"),
+                latitude=coordinates.get("latitude"),
+                longitude=coordinates.get("longitude"),
                 images=listing_data.get("imageUrls") or [],
-                **{
-                    k: attributes.get(k)
-                    for k in ATTRIBUTE_MAPPING.values()
-                    if k not in _SEPARATELY_HANDLED_FIELDS
-                },
+                **{field: attributes.get(field) for field in _PASSTHROUGH_FIELDS},
                 **scores,
+                scraped_at=self.scraped_at,
             )
             return listing
 
         except requests.RequestException:
             logger.exception("HTTP error fetching listing %s", url)
             return None
-        except (json.JSONDecodeError, KeyError, TypeError, ValidationError) as exc:
+        except (orjson.JSONDecodeError, KeyError, TypeError, ValidationError) as exc:
             logger.warning("Failed to parse listing data for %s: %s", url, type(exc).__name__)
             return None
 
@@ -260,15 +345,21 @@ class KijijiScraper(BaseScraper):
             return None
 
         try:
-            return json.loads(script.string)
-        except json.JSONDecodeError:
+            return orjson.loads(str(script.string))
+        except orjson.JSONDecodeError:
             return None
 
     def _extract_attributes(self, listing_data: dict) -> dict[str, str | None]:
         """Extract and normalize attributes from listing data."""
-        attributes_raw = listing_data.get("attributes", {}).get("all", [])
-        raw_dict = {attr["name"]: attr.get("values", [None])[0] for attr in attributes_raw}
-        return {ATTRIBUTE_MAPPING[k]: v for k, v in raw_dict.items() if k in ATTRIBUTE_MAPPING}
+        mapping = ATTRIBUTE_MAPPING
+        attributes: dict[str, str | None] = {}
+        # Single pass: unmapped attributes are skipped before their values are touched
+        for attr in listing_data.get("attributes", {}).get("all", ()):
+            field = mapping.get(attr.get("name"))
+            if field is not None:
+                values = attr.get("values")
+                attributes[field] = values[0] if values else None
+        return attributes
 
     def _extract_neighbourhood_info(
         self, listing_data: dict, apollo_state: dict
@@ -1,6 +1,8 @@
 """Prefect tasks for storage operations (MinIO, etc)."""
 
-from datetime import UTC, date, datetime
+from datetime import date, datetime
+from types import NoneType, UnionType
+from typing import Any, Union, get_args, get_origin
 
 import polars as pl
 from prefect import get_run_logger, task
@@ -10,19 +12,72 @@ from real_estate_data_platform.connectors.minio import MinIOStorage
 from real_estate_data_platform.models.enums import DateMode
 from real_estate_data_platform.models.listings import RentalsListing
 from real_estate_data_platform.models.responses import ScrapeMetadata, StorageResult
+from real_estate_data_platform.utils.dates import utc_now_seconds
+from real_estate_data_platform.utils.paths import bronze_parquet_path
+
+# Parquet footer key holding the JSON-serialized ScrapeMetadata of a bronze file
+SCRAPE_METADATA_KEY = "scrape_metadata"
+
+
+def _polars_dtype(annotation: Any) -> pl.DataType:
+    """Map a RentalsListing field annotation to its Polars dtype.
+
+    Args:
+        annotation: Field type annotation (e.g. ``float | None``, ``list[str]``)
+
+    Returns:
+        Polars dtype for the column
+
+    Raises:
+        TypeError: If the annotation has no Polars mapping
+    """
+    if get_origin(annotation) in (Union, UnionType):
+        members = [arg for arg in get_args(annotation) if arg is not NoneType]
+        if len(members) != 1:
+            raise TypeError(f"No Polars dtype for annotation {annotation!r}")
+        annotation = members[0]
+    if get_origin(annotation) is list:
+        return pl.List(_polars_dtype(get_args(annotation)[0]))
+    if annotation is datetime:
+        return pl.Datetime("us", "UTC")
+    if annotation is date:
+        return pl.Date()
+    if annotation is bool:
+        return pl.Boolean()
+    if annotation is int:
+        return pl.Int64()
+    if annotation is float:
+        return pl.Float64()
+    if isinstance(annotation, type) and issubclass(annotation, str):  # str and StrEnum
+        return pl.String()
+    raise TypeError(f"No Polars dtype for annotation {annotation!r}")
+
+
+# Bronze listing schema, derived once from the model so Polars skips type inference
+_LISTING_SCHEMA = pl.Schema(
+    {name: _polars_dtype(field.annotation) for name, field in RentalsListing.model_fields.items()}
+)
 
 
 @task(cache_policy=NONE)
 def listings_to_dataframe(listings: list[RentalsListing]) -> pl.DataFrame:
     """Convert a list of RentalsListing objects to a Polars DataFrame.
 
+    Columns are gathered straight from the model attributes instead of building
+    an intermediate ``model_dump()`` dict per listing, and loaded with a fixed
+    schema so Polars does no type inference. Columns that are null for every
+    listing keep their declared dtype instead of becoming ``Null``.
+
     Args:
         listings: List of RentalsListing Pydantic models
 
     Returns:
         Polars DataFrame with one row per listing
     """
-    return pl.DataFrame([listing.model_dump() for listing in listings])
+    columns = {
+        field: [getattr(listing, field) for listing in listings] for field in _LISTING_SCHEMA
+    }
+    return pl.DataFrame(columns, schema=_LISTING_SCHEMA)
 
 
 @task(cache_policy=NONE, retries=2, retry_delay_seconds=[5, 30])
@@ -37,7 +92,10 @@ def save_listings_to_minio(
     days: int,
     specific_date: date | None = None,
 ) -> StorageResult:
-    """Save a listings DataFrame to MinIO as Parquet with JSON metadata.
+    """Save a listings DataFrame to MinIO as Parquet with embedded scrape metadata.
+
+    The ``ScrapeMetadata`` is stored as JSON under the ``SCRAPE_METADATA_KEY``
+    key of the Parquet footer, so each run adds exactly one object to the partition.
 
     Args:
         df: Polars DataFrame with listing data
@@ -55,32 +113,23 @@ def save_listings_to_minio(
     """
     logger = get_run_logger()
 
-    # Prepare file paths
-    datestamp = partition_date.replace("-", "")
-    base_dir = f"listings/source={source}/city={city}/dt={partition_date}"
-    parquet_path = f"{base_dir}/listings_{datestamp}.parquet"
-    metadata_path = f"{base_dir}/_metadata.json"
+    parquet_path = bronze_parquet_path(source, city, partition_date)
 
-    # Save Parquet file
-    storage.save_parquet(
-        dataframe=df,
-        object_name=parquet_path,
-    )
-
-    # Build and save metadata
+    # Build metadata
     metadata = ScrapeMetadata(
         mode=mode,
         days=days,
         specific_date=specific_date,
         max_pages=max_pages,
         record_count=df.height,
-        saved_at=datetime.now(UTC),
+        saved_at=utc_now_seconds(),
     )
 
-    # Save metadata JSON
-    storage.save_json(
-        data=metadata.model_dump(mode="json"),
-        object_name=metadata_path,
+    # Save Parquet file with the metadata in its footer
+    storage.save_parquet(
+        dataframe=df,
+        object_name=parquet_path,
+        metadata={SCRAPE_METADATA_KEY: metadata.model_dump_json()},
     )
 
     logger.info("Successfully saved %d listings to %s", df.height, parquet_path)
@@ -5,6 +5,7 @@ from prefect import get_run_logger, task
 from prefect.cache_policies import NONE
 
 from real_estate_data_platform.connectors.minio import MinIOStorage
+from real_estate_data_platform.utils.paths import bronze_partition_prefix
 
 
 @task(cache_policy=NONE, retries=2, retry_delay_seconds=[5, 30])
@@ -30,7 +31,7 @@ def read_bronze_listings(
     """
     logger = get_run_logger()
 
-    prefix = f"listings/source={source}/city={city}/dt={partition_date}/"
+    prefix = bronze_partition_prefix(source, city, partition_date)
     parquet_files = storage.list_objects(prefix=prefix, suffix=".parquet")
 
     if not parquet_files:
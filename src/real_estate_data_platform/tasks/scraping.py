@@ -2,22 +2,61 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from datetime import timedelta
+from typing import TYPE_CHECKING, Any
 
 from prefect import get_run_logger, task
+from prefect.transactions import get_transaction
 
 from real_estate_data_platform.models.enums import City
 from real_estate_data_platform.models.listings import RentalsListing
 from real_estate_data_platform.models.responses import ScrapingResult
+from real_estate_data_platform.utils.dates import format_date
 
 if TYPE_CHECKING:
+    from prefect.context import TaskRunContext
+
     from real_estate_data_platform.scrapers.base_scraper import BaseScraper
 
 
+def _page_cache_key(context: TaskRunContext, parameters: dict[str, Any]) -> str:
+    """Cache key identifying a parsed page: site, city, page, date filter and scrape day.
+
+    The scraper instance itself (session, locks) is not hashable, so the key is built
+    from the scraper settings that determine the parsed output.
+    """
+    scraper: BaseScraper = parameters["scraper"]
+    return ":".join(
+        (
+            scraper.name_website,
+            parameters["city"].value,
+            str(parameters["page"]),
+            scraper.scraper_mode.value,
+            str(scraper.days),
+            str(scraper.specific_date),
+            format_date(scraper.scraped_at),
+        )
+    )
+
+
+def _skip_result_cache() -> None:
+    """Keep the running task's result out of the cache, so a re-run fetches it again."""
+    transaction = get_transaction()
+    if transaction is not None:
+        transaction.write_on_commit = False
+
+
+# Transient HTTP errors are already retried by the scraper's session; one task-level
+# retry remains as a last resort for anything the HTTP layer cannot recover from.
 @task(
-    retries=3,
-    retry_delay_seconds=[2, 10, 30],
+    retries=1,
+    retry_delay_seconds=30,
     timeout_seconds=1200,
+    # Re-runs of the same day (backfills, a failed save) replay fully parsed pages from
+    # the result store instead of scraping them again. Partial or empty pages are not
+    # cached, so a re-run after failures retries them.
+    cache_key_fn=_page_cache_key,
+    cache_expiration=timedelta(hours=6),
 )
 def fetch_and_parse_page(
     scraper: BaseScraper,
@@ -26,13 +65,19 @@ def fetch_and_parse_page(
 ) -> ScrapingResult:
     """Fetch and parse a single page using the provided scraper.
 
+    A page replayed from the cache does not go through the scraper, so its listing
+    URLs are not claimed for the run; the caller claims them with
+    ``BaseScraper.claim_urls`` when it collects the result. Pages already being fetched
+    by then may still request those listings.
+
     Args:
         scraper: Instance of a BaseScraper subclass (e.g., KijijiScraper)
         city: City to scrape (City enum)
         page: Page number
 
     Returns:
-        ScrapingResult containing parsed listings
+        ScrapingResult containing parsed listings. Only pages with listings and no
+        failed listings are cached.
     """
     logger = get_run_logger()
 
@@ -40,6 +85,8 @@ def fetch_and_parse_page(
     listings, failed_listings = scraper.parse_page(soup=soup, city=city)
 
     logger.info("Page %d: %d listings parsed, %d failed", page, len(listings), failed_listings)
+    if failed_listings or not listings:
+        _skip_result_cache()
 
     return ScrapingResult(
         page_number=page,
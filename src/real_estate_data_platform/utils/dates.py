@@ -1,25 +1,65 @@
 """Date and time utilities."""
 
+import time
 from datetime import UTC, date, datetime, timedelta
+from functools import lru_cache
 
+# (epoch second, matching UTC datetime) of the last utc_now_seconds() call.
+# Swapped as a single tuple so concurrent readers never see a torn pair.
+_now_cache: tuple[int, datetime] = (-1, datetime.min.replace(tzinfo=UTC))
 
-def parse_iso_datetime(value: str | None) -> datetime | None:
+
+def parse_iso_datetime(value: str | date | None) -> datetime | None:
     """Parse an ISO 8601 datetime string (e.g., '2026-02-12T08:03:15.000Z').
 
     Args:
-        value: ISO datetime string, optionally with 'Z' suffix.
+        value: ISO datetime string, optionally with 'Z' suffix. A datetime is
+            returned unchanged and a date becomes midnight of that day.
 
     Returns:
         Parsed datetime or None if parsing fails.
     """
     if not value:
         return None
+    if isinstance(value, datetime):
+        return value
+    if isinstance(value, date):
+        return datetime.combine(value, datetime.min.time())
+    if not isinstance(value, str):
+        return None
+    return _parse_iso_string(value)
+
+
+# Listings on one search page often share an activation timestamp; datetimes are
+# immutable, so repeated strings can safely return the same parsed object.
+@lru_cache(maxsize=4096)
+def _parse_iso_string(value: str) -> datetime | None:
     try:
-        return datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+        # fromisoformat accepts a trailing 'Z' natively (Python 3.11+), no rewrite needed
+        return datetime.fromisoformat(value)
     except ValueError:
         return None
 
 
+def utc_now_seconds() -> datetime:
+    """Return the current UTC time truncated to whole seconds.
+
+    The ``datetime`` is built at most once per second and reused for every call
+    within that second, for audit timestamps where sub-second precision is
+    irrelevant.
+
+    Returns:
+        Timezone-aware UTC datetime with ``microsecond == 0``
+    """
+    global _now_cache
+    second = int(time.time())
+    cached_second, cached = _now_cache
+    if second != cached_second:
+        cached = datetime.fromtimestamp(second, UTC)
+        _now_cache = (second, cached)
+    return cached
+
+
 def format_date(dt: date | datetime | None = None) -> str:
     """Format date in ISO format (YYYY-MM-DD).
 
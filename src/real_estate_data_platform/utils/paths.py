@@ -0,0 +1,38 @@
+"""Object-path utilities for the bronze layer."""
+
+from uuid import uuid4
+
+# Bound ``str.format`` methods of the path templates, built once at import
+_PARTITION_PREFIX = "listings/source={}/city={}/dt={}/".format
+_PARQUET_NAME = "part-{}.parquet".format
+
+
+def bronze_partition_prefix(source: str, city: str, partition_date: str) -> str:
+    """Build the object prefix of a bronze partition.
+
+    Args:
+        source: Data source name (e.g., 'kijiji')
+        city: City name (e.g., 'toronto')
+        partition_date: Date string (YYYY-MM-DD)
+
+    Returns:
+        Prefix like 'listings/source=kijiji/city=toronto/dt=2026-02-27/'
+    """
+    return _PARTITION_PREFIX(source, city, partition_date)
+
+
+def bronze_parquet_path(source: str, city: str, partition_date: str) -> str:
+    """Build a new, unique object path for a Parquet file in a bronze partition.
+
+    Every call yields a fresh ``part-<uuid>.parquet`` name, so each write adds a file
+    to the partition and never overwrites an earlier run of the same day.
+
+    Args:
+        source: Data source name (e.g., 'kijiji')
+        city: City name (e.g., 'toronto')
+        partition_date: Date string (YYYY-MM-DD)
+
+    Returns:
+        Path like 'listings/source=kijiji/city=toronto/dt=2026-02-27/part-<32 hex>.parquet'
+    """
+    return _PARTITION_PREFIX(source, city, partition_date) + _PARQUET_NAME(uuid4().hex)
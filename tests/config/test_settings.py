@@ -0,0 +1,31 @@
+"""Tests for real_estate_data_platform.config.settings."""
+
+import pytest
+
+from real_estate_data_platform.config import settings as settings_module
+from real_estate_data_platform.config.settings import PostgresSettings, get_settings
+
+
+class TestGetSettings:
+    """Tests for lazy, process-wide settings loading."""
+
+    def test_returns_shared_instance(self):
+        assert get_settings() is get_settings()
+
+    def test_module_attribute_resolves_lazily(self):
+        assert settings_module.settings is get_settings()
+
+    def test_unknown_module_attribute_raises(self):
+        with pytest.raises(AttributeError):
+            _ = settings_module.not_a_setting
+
+
+class TestPostgresDsn:
+    """Tests for the cached DSN."""
+
+    def test_dsn_is_built_once(self):
+        pg = PostgresSettings(host="db", port=5433, user="u", password="p", db="d")
+
+        assert pg.dsn == "postgresql://u:p@db:5433/d"
+        assert pg.dsn is pg.dsn
+        assert pg.model_dump()["dsn"] == pg.dsn
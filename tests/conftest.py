@@ -0,0 +1,15 @@
+"""Shared fixtures for all tests."""
+
+import pytest
+from prefect.settings import PREFECT_LOCAL_STORAGE_PATH, temporary_settings
+
+
+@pytest.fixture(autouse=True)
+def _isolated_prefect_storage(tmp_path):
+    """Keep task results and cache records out of the developer's Prefect storage.
+
+    Cached tasks (e.g. fetch_and_parse_page) would otherwise leave records whose keys
+    match a real same-day scrape, which would then replay the mocked results.
+    """
+    with temporary_settings({PREFECT_LOCAL_STORAGE_PATH: tmp_path / "prefect-storage"}):
+        yield
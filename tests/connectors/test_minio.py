@@ -0,0 +1,417 @@
+"""Unit tests for MinIOStorage connector."""
+
+import io
+import os
+import socket
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import polars as pl
+import pytest
+import urllib3
+from minio.error import S3Error
+
+from real_estate_data_platform.connectors.minio import (
+    _NUM_PARALLEL_UPLOADS,
+    _VERIFIED_BUCKETS,
+    MinIOStorage,
+    _get_client,
+    _Pipe,
+    get_storage,
+)
+
+_PATCH_PREFIX = "real_estate_data_platform.connectors.minio"
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+@pytest.fixture(autouse=True)
+def _reset_client_cache():
+    """Isolate tests from the process-wide client and bucket caches."""
+    _get_client.cache_clear()
+    get_storage.cache_clear()
+    _VERIFIED_BUCKETS.clear()
+    yield
+    _get_client.cache_clear()
+    get_storage.cache_clear()
+    _VERIFIED_BUCKETS.clear()
+
+
+def _build_storage() -> MinIOStorage:
+    """Build a MinIOStorage with a mocked Minio client (bucket already exists)."""
+    with patch(f"{_PATCH_PREFIX}.Minio") as mock_minio_cls:
+        mock_client = MagicMock()
+        mock_client.bucket_exists.return_value = True
+        mock_minio_cls.return_value = mock_client
+        storage = MinIOStorage(
+            endpoint="localhost:9000",
+            access_key="key",
+            secret_key="secret",
+            bucket_name="raw",
+        )
+    return storage
+
+
+def _drain(data, chunk_size: int = 7) -> bytes:
+    """Read a stream the way ``put_object`` does: fixed-size reads until EOF."""
+    parts = []
+    while chunk := data.read(chunk_size):
+        parts.append(chunk)
+    return b"".join(parts)
+
+
+# ---------------------------------------------------------------------------
+# HTTP client
+# ---------------------------------------------------------------------------
+class TestHttpClient:
+    """Tests for the connection pool handed to the Minio client."""
+
+    def test_pool_covers_parallel_part_uploads(self):
+        with patch(f"{_PATCH_PREFIX}.Minio") as mock_minio_cls:
+            mock_minio_cls.return_value.bucket_exists.return_value = True
+            MinIOStorage(endpoint="localhost:9000", access_key="key", secret_key="secret")
+
+        http_client = mock_minio_cls.call_args.kwargs["http_client"]
+        assert isinstance(http_client, urllib3.PoolManager)
+        assert http_client.connection_pool_kw["maxsize"] >= _NUM_PARALLEL_UPLOADS
+        # Exhausted pools wait for a connection rather than opening throwaway ones
+        assert http_client.connection_pool_kw["block"] is True
+
+    def test_sockets_use_nodelay_and_keepalive(self):
+        with patch(f"{_PATCH_PREFIX}.Minio") as mock_minio_cls:
+            mock_minio_cls.return_value.bucket_exists.return_value = True
+            MinIOStorage(endpoint="localhost:9000", access_key="key", secret_key="secret")
+
+        http_client = mock_minio_cls.call_args.kwargs["http_client"]
+        socket_options = http_client.connection_pool_kw["socket_options"]
+        assert (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1) in socket_options
+        assert (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1) in socket_options
+
+
+# ---------------------------------------------------------------------------
+# Client / bucket caching
+# ---------------------------------------------------------------------------
+class TestClientCache:
+    """Tests for sharing the Minio client and bucket check across instances."""
+
+    def test_reuses_client_and_checks_bucket_once(self):
+        with patch(f"{_PATCH_PREFIX}.Minio") as mock_minio_cls:
+            mock_minio_cls.return_value.bucket_exists.return_value = True
+            first = MinIOStorage(endpoint="localhost:9000", access_key="key", secret_key="secret")
+            second = MinIOStorage(endpoint="localhost:9000", access_key="key", secret_key="secret")
+            first.list_objects("a/")
+            second.list_objects("b/")
+
+        assert first.client is second.client
+        mock_minio_cls.assert_called_once()
+        mock_minio_cls.return_value.bucket_exists.assert_called_once_with("raw")
+
+    def test_checks_each_bucket(self):
+        with patch(f"{_PATCH_PREFIX}.Minio") as mock_minio_cls:
+            mock_minio_cls.return_value.bucket_exists.return_value = False
+            MinIOStorage(endpoint="localhost:9000", access_key="k", secret_key="s").list_objects(
+                "a/"
+            )
+            MinIOStorage(
+                endpoint="localhost:9000", access_key="k", secret_key="s", bucket_name="b"
+            ).list_objects("a/")
+
+        assert mock_minio_cls.return_value.make_bucket.call_count == 2
+
+    def test_failed_check_is_retried(self):
+        with patch(f"{_PATCH_PREFIX}.Minio") as mock_minio_cls:
+            mock_client = mock_minio_cls.return_value
+            mock_client.bucket_exists.side_effect = [
+                S3Error("AccessDenied", "denied", "", "", "", MagicMock()),
+                True,
+            ]
+            storage = MinIOStorage(endpoint="localhost:9000", access_key="k", secret_key="s")
+            with pytest.raises(S3Error):
+                storage.list_objects("a/")
+            storage.list_objects("a/")
+
+        assert mock_client.bucket_exists.call_count == 2
+        mock_client.list_objects.assert_called_once()
+
+    def test_concurrent_instances_check_bucket_once(self):
+        with patch(f"{_PATCH_PREFIX}.Minio") as mock_minio_cls:
+            mock_client = mock_minio_cls.return_value
+            mock_client.bucket_exists.side_effect = lambda _: time.sleep(0.05) or True
+            storages = [
+                MinIOStorage(endpoint="localhost:9000", access_key="k", secret_key="s")
+                for _ in range(4)
+            ]
+            threads = [threading.Thread(target=s.list_objects, args=("x/",)) for s in storages]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        mock_client.bucket_exists.assert_called_once_with("raw")
+
+    def test_get_storage_reuses_instance(self):
+        with patch(f"{_PATCH_PREFIX}.Minio"):
+            first = get_storage("localhost:9000", "k", "s", bucket_name="raw")
+            second = get_storage("localhost:9000", "k", "s", bucket_name="raw")
+            other = get_storage("localhost:9000", "k", "s", bucket_name="other")
+
+        assert first is second
+        assert other is not first
+        assert other.client is first.client
+
+
+# ---------------------------------------------------------------------------
+# Lazy bucket check
+# ---------------------------------------------------------------------------
+class TestLazyBucketCheck:
+    """Tests for deferring the bucket check until the first operation."""
+
+    def test_construction_makes_no_requests(self):
+        with patch(f"{_PATCH_PREFIX}.Minio") as mock_minio_cls:
+            MinIOStorage(endpoint="localhost:9000", access_key="k", secret_key="s")
+
+        mock_minio_cls.return_value.bucket_exists.assert_not_called()
+
+    def test_first_read_creates_missing_bucket(self):
+        with patch(f"{_PATCH_PREFIX}.Minio") as mock_minio_cls:
+            mock_client = mock_minio_cls.return_value
+            mock_client.bucket_exists.return_value = False
+            mock_client.list_objects.return_value = iter([])
+            storage = MinIOStorage(endpoint="localhost:9000", access_key="k", secret_key="s")
+
+            assert storage.list_objects("listings/") == []
+
+        mock_client.make_bucket.assert_called_once_with("raw")
+
+
+# ---------------------------------------------------------------------------
+# _Pipe
+# ---------------------------------------------------------------------------
+class TestPipe:
+    """Tests for the bounded writer → reader byte pipe."""
+
+    def test_reads_back_written_bytes(self):
+        pipe = _Pipe(max_chunks=2)
+
+        def _write():
+            for i in range(50):
+                pipe.write(f"chunk-{i};".encode())
+            pipe.close()
+
+        writer = threading.Thread(target=_write)
+        writer.start()
+        result = _drain(pipe)
+        writer.join()
+
+        assert result == b"".join(f"chunk-{i};".encode() for i in range(50))
+
+    def test_read_respects_requested_size(self):
+        pipe = _Pipe()
+        pipe.write(b"abcdefghij")
+        pipe.close()
+
+        assert pipe.read(4) == b"abcd"
+        assert pipe.read(4) == b"efgh"
+        assert pipe.read(4) == b"ij"
+        assert pipe.read(4) == b""
+
+    def test_read_splits_only_boundary_chunk(self):
+        pipe = _Pipe()
+        for chunk in (b"abc", b"defg", b"hi"):
+            pipe.write(chunk)
+        pipe.close()
+
+        assert pipe.read(5) == b"abcde"
+        assert pipe.read(-1) == b"fghi"
+        assert pipe.read(5) == b""
+
+    def test_read_returns_bytes(self):
+        pipe = _Pipe()
+        pipe.write(memoryview(b"xyz"))
+        pipe.close()
+
+        assert isinstance(pipe.read(10), bytes)
+
+    def test_writer_error_is_raised_by_reader(self):
+        pipe = _Pipe()
+        pipe.write(b"partial")
+        pipe.close(error=RuntimeError("serialization failed"))
+
+        with pytest.raises(RuntimeError, match="serialization failed"):
+            pipe.read(100)
+
+    def test_abort_unblocks_writer(self):
+        pipe = _Pipe(max_chunks=1)
+        pipe.write(b"fills the queue")
+        errors = []
+
+        def _write():
+            try:
+                pipe.write(b"blocks until aborted")
+            except BrokenPipeError as exc:
+                errors.append(exc)
+
+        writer = threading.Thread(target=_write)
+        writer.start()
+        pipe.abort()
+        writer.join(timeout=5)
+
+        assert not writer.is_alive()
+        assert len(errors) == 1
+
+
+# ---------------------------------------------------------------------------
+# save_parquet
+# ---------------------------------------------------------------------------
+class TestSaveParquet:
+    """Tests for streaming Parquet uploads."""
+
+    def test_streams_parquet_with_unknown_length(self):
+        storage = _build_storage()
+        df = pl.DataFrame({"a": list(range(1000)), "b": ["x"] * 1000})
+        uploaded = {}
+
+        def _put_object(**kwargs):
+            uploaded.update(kwargs)
+            uploaded["payload"] = _drain(kwargs["data"], chunk_size=1024)
+
+        storage.client.put_object.side_effect = _put_object
+
+        storage.save_parquet(df, "listings/test.parquet")
+
+        assert uploaded["object_name"] == "listings/test.parquet"
+        assert uploaded["length"] == -1
+        assert uploaded["part_size"] == 6 * 1024 * 1024
+        assert uploaded["num_parallel_uploads"] > 1
+        assert pl.read_parquet(io.BytesIO(uploaded["payload"])).equals(df)
+
+    def test_writes_zstd_with_statistics(self):
+        storage = _build_storage()
+        df = pl.DataFrame({"a": list(range(1000))})
+        storage.client.put_object.side_effect = lambda **kwargs: _drain(kwargs["data"], 1024)
+
+        with patch.object(
+            pl.DataFrame, "write_parquet", autospec=True, side_effect=pl.DataFrame.write_parquet
+        ) as mock_write:
+            storage.save_parquet(df, "listings/test.parquet")
+
+        kwargs = mock_write.call_args.kwargs
+        assert kwargs["compression"] == "zstd"
+        assert kwargs["compression_level"] == 3
+        assert kwargs["row_group_size"] == 50_000
+        assert kwargs["statistics"] is True
+
+    def test_embeds_key_value_metadata(self):
+        storage = _build_storage()
+        uploaded = {}
+
+        def _put_object(**kwargs):
+            uploaded["payload"] = _drain(kwargs["data"], chunk_size=1024)
+
+        storage.client.put_object.side_effect = _put_object
+
+        storage.save_parquet(pl.DataFrame({"a": [1]}), "t.parquet", metadata={"k": "v"})
+
+        assert pl.read_parquet_metadata(io.BytesIO(uploaded["payload"]))["k"] == "v"
+
+    def test_uses_configured_part_size(self):
+        with patch(f"{_PATCH_PREFIX}.Minio"):
+            storage = MinIOStorage(
+                endpoint="localhost:9000",
+                access_key="key",
+                secret_key="secret",
+                part_size=16 * 1024 * 1024,
+            )
+        storage.client.put_object.side_effect = lambda **kwargs: _drain(kwargs["data"], 1024)
+
+        storage.save_parquet(pl.DataFrame({"a": [1]}), "t.parquet")
+
+        assert storage.client.put_object.call_args.kwargs["part_size"] == 16 * 1024 * 1024
+
+    def test_upload_error_propagates_and_stops_writer(self):
+        storage = _build_storage()
+        df = pl.DataFrame({"a": list(range(100_000))})
+
+        def _put_object(**kwargs):
+            kwargs["data"].read(10)
+            raise RuntimeError("network down")
+
+        storage.client.put_object.side_effect = _put_object
+
+        with pytest.raises(RuntimeError, match="network down"):
+            storage.save_parquet(df, "listings/test.parquet")
+
+
+# ---------------------------------------------------------------------------
+# list_objects / iter_objects
+# ---------------------------------------------------------------------------
+class TestListObjects:
+    """Tests for object listing with suffix filtering."""
+
+    @staticmethod
+    def _storage_with_objects(*names: str | None) -> MinIOStorage:
+        storage = _build_storage()
+        storage.client.list_objects.return_value = iter(MagicMock(object_name=n) for n in names)
+        return storage
+
+    def test_filters_by_suffix(self):
+        storage = self._storage_with_objects("a.parquet", "_metadata.json", None, "b.parquet")
+
+        assert storage.list_objects("listings/", suffix=".parquet") == ["a.parquet", "b.parquet"]
+
+    def test_filters_by_suffix_tuple(self):
+        storage = self._storage_with_objects("a.parquet", "_metadata.json", "c.csv")
+
+        result = storage.list_objects("listings/", suffix=(".parquet", ".json"))
+
+        assert result == ["a.parquet", "_metadata.json"]
+
+    def test_iter_objects_is_lazy(self):
+        storage = self._storage_with_objects("a.parquet", "b.parquet")
+
+        names = storage.iter_objects("listings/")
+
+        storage.client.list_objects.assert_not_called()
+        assert next(names) == "a.parquet"
+        storage.client.list_objects.assert_called_once_with(
+            "raw", prefix="listings/", recursive=True
+        )
+
+
+# ---------------------------------------------------------------------------
+# read_parquet
+# ---------------------------------------------------------------------------
+class TestReadParquet:
+    """Tests for reading Parquet objects through a temporary file."""
+
+    def test_downloads_to_temp_file_and_cleans_up(self):
+        storage = _build_storage()
+        df = pl.DataFrame({"a": [1, 2, 3], "b": ["x", "y", "z"]})
+        downloaded = []
+
+        def _fget_object(bucket_name, object_name, file_path):
+            downloaded.append(file_path)
+            df.write_parquet(file_path)
+
+        storage.client.fget_object.side_effect = _fget_object
+
+        result = storage.read_parquet("listings/test.parquet")
+
+        assert result.equals(df)
+        assert storage.client.fget_object.call_args.args[:2] == ("raw", "listings/test.parquet")
+        assert not os.path.exists(downloaded[0])
+
+    def test_propagates_s3_error_without_logging_traceback(self, caplog):
+        storage = _build_storage()
+        storage.client.fget_object.side_effect = S3Error(
+            "NoSuchKey", "missing", "", "", "", MagicMock()
+        )
+
+        with pytest.raises(S3Error):
+            storage.read_parquet("listings/missing.parquet")
+
+        (record,) = caplog.records
+        assert "listings/missing.parquet" in record.getMessage()
+        assert record.exc_info is None
@@ -0,0 +1,115 @@
+"""Unit tests for the scrape_to_bronze Prefect flow."""
+
+import threading
+from datetime import UTC, datetime
+from unittest.mock import patch
+
+from real_estate_data_platform.models.enums import City, FlowStatus
+from real_estate_data_platform.models.listings import RentalsListing
+from real_estate_data_platform.models.responses import StorageResult
+from real_estate_data_platform.scrapers.kijiji_scraper import KijijiScraper
+from real_estate_data_platform.scrapers.scraper_type import ScraperType
+
+_PATCH_PREFIX = "real_estate_data_platform.flows.scrape_to_bronze_flow"
+
+
+def _listing(listing_id: str) -> RentalsListing:
+    """Build a minimal valid listing."""
+    return RentalsListing(
+        listing_id=listing_id,
+        url=f"https://kijiji.ca/v/{listing_id}",
+        website="kijiji",
+        published_at=datetime.now(UTC),
+        title="Nice Condo",
+        description="A lovely place",
+        street="123 Main St",
+        city=City.TORONTO,
+    )
+
+
+class TestScrapeToBronzeFlow:
+    """Tests for the scrape_to_bronze flow."""
+
+    @patch(f"{_PATCH_PREFIX}.save_listings_to_minio")
+    @patch(f"{_PATCH_PREFIX}.get_storage")
+    def test_fetches_pages_concurrently(self, _mock_get_storage, mock_save):
+        from real_estate_data_platform.flows.scrape_to_bronze_flow import scrape_to_bronze
+
+        max_pages = 3
+        # Every page blocks until all pages are in flight at once
+        all_in_flight = threading.Barrier(max_pages, timeout=10)
+
+        def _get_page(self, city, page=1):
+            all_in_flight.wait()
+            return page
+
+        def _parse_page(self, soup, city):
+            return [_listing(str(soup))], 0
+
+        mock_save.return_value = StorageResult(path="raw/listings.parquet", count=max_pages)
+
+        with (
+            patch.object(KijijiScraper, "get_page", _get_page),
+            patch.object(KijijiScraper, "parse_page", _parse_page),
+        ):
+            result = scrape_to_bronze(
+                scraper_type=ScraperType.KIJIJI, city=City.TORONTO, max_pages=max_pages
+            )
+
+        assert result.status == FlowStatus.SUCCESS
+        assert result.total_listings == max_pages
+        df = mock_save.call_args.kwargs["df"]
+        assert sorted(df["listing_id"].to_list()) == ["1", "2", "3"]
+
+    @patch(f"{_PATCH_PREFIX}.save_listings_to_minio")
+    @patch(f"{_PATCH_PREFIX}.get_storage")
+    def test_claims_urls_of_collected_pages(self, _mock_get_storage, mock_save):
+        from real_estate_data_platform.flows.scrape_to_bronze_flow import scrape_to_bronze
+
+        claimed = []
+
+        def _parse_page(self, soup, city):
+            return [_listing(str(soup))], 0
+
+        mock_save.return_value = StorageResult(path="raw/listings.parquet", count=2)
+
+        with (
+            patch.object(KijijiScraper, "get_page", lambda self, city, page=1: page),
+            patch.object(KijijiScraper, "parse_page", _parse_page),
+            patch.object(KijijiScraper, "claim_urls", lambda self, urls: claimed.extend(urls)),
+        ):
+            scrape_to_bronze(scraper_type=ScraperType.KIJIJI, city=City.TORONTO, max_pages=2)
+
+        assert sorted(claimed) == ["https://kijiji.ca/v/1", "https://kijiji.ca/v/2"]
+
+    @patch(f"{_PATCH_PREFIX}.save_listings_to_minio")
+    @patch(f"{_PATCH_PREFIX}.get_storage")
+    def test_failed_page_is_skipped(self, _mock_get_storage, mock_save):
+        from real_estate_data_platform.flows.scrape_to_bronze_flow import scrape_to_bronze
+        from real_estate_data_platform.tasks.scraping import fetch_and_parse_page
+
+        def _get_page(self, city, page=1):
+            if page == 2:
+                raise RuntimeError("page 2 down")
+            return page
+
+        def _parse_page(self, soup, city):
+            return [_listing(str(soup))], 0
+
+        mock_save.return_value = StorageResult(path="raw/listings.parquet", count=2)
+
+        with (
+            patch.object(KijijiScraper, "get_page", _get_page),
+            patch.object(KijijiScraper, "parse_page", _parse_page),
+            patch(
+                f"{_PATCH_PREFIX}.fetch_and_parse_page",
+                fetch_and_parse_page.with_options(retries=0),
+            ),
+        ):
+            result = scrape_to_bronze(
+                scraper_type=ScraperType.KIJIJI, city=City.TORONTO, max_pages=3
+            )
+
+        assert result.status == FlowStatus.SUCCESS
+        assert result.total_listings == 2
+        assert mock_save.call_args.kwargs["df"]["listing_id"].to_list() == ["1", "3"]
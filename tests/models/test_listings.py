@@ -0,0 +1,52 @@
+"""Unit tests for the RentalsListing model validation."""
+
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from pydantic import ValidationError
+
+from real_estate_data_platform.models.enums import City
+from real_estate_data_platform.models.listings import RentalsListing
+
+
+def _listing(**kwargs) -> RentalsListing:
+    """Build a RentalsListing with minimal valid defaults."""
+    defaults = {
+        "listing_id": "test-001",
+        "url": "https://www.kijiji.ca/v-apartments-condos/toronto/test/1",
+        "website": "kijiji",
+        "published_at": datetime.now(UTC),
+        "title": "Test listing",
+        "description": "A test listing",
+        "street": "123 Test St",
+        "city": City.TORONTO,
+    }
+    defaults.update(kwargs)
+    return RentalsListing(**defaults)
+
+
+# ---------------------------------------------------------------------------
+# url
+# ---------------------------------------------------------------------------
+class TestUrlValidation:
+    """Tests for the URL scheme check."""
+
+    @pytest.mark.parametrize("url", ["https://kijiji.ca/v/1", "http://kijiji.ca/v/1"])
+    def test_accepts_http_and_https(self, url):
+        assert _listing(url=url).url == url
+
+    @pytest.mark.parametrize("url", ["ftp://kijiji.ca/v/1", "kijiji.ca/v/1", " https://x"])
+    def test_rejects_other_schemes(self, url):
+        with pytest.raises(ValidationError):
+            _listing(url=url)
+
+
+# ---------------------------------------------------------------------------
+# published_at
+# ---------------------------------------------------------------------------
+class TestPublishedAtValidation:
+    """Tests for the future publish date check."""
+
+    def test_rejects_future_date(self):
+        with pytest.raises(ValidationError):
+            _listing(published_at=datetime.now(UTC) + timedelta(days=1))
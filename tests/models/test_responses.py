@@ -0,0 +1,55 @@
+"""Unit tests for the operation result models."""
+
+import pytest
+from pydantic import ValidationError
+
+from real_estate_data_platform.models.enums import FlowStatus
+from real_estate_data_platform.models.responses import (
+    BronzeToSilverResult,
+    PartitionResult,
+    StorageResult,
+)
+
+
+def _partition(status: FlowStatus, rows_read: int = 0) -> PartitionResult:
+    return PartitionResult(
+        status=status,
+        source="kijiji",
+        city="toronto",
+        partition_date="2026-02-27",
+        rows_read=rows_read,
+        rows_loaded=rows_read,
+    )
+
+
+# ---------------------------------------------------------------------------
+# _BaseResult
+# ---------------------------------------------------------------------------
+class TestResultModels:
+    """Tests shared by all result models."""
+
+    def test_results_are_frozen(self):
+        result = StorageResult(path="raw/listings.parquet", count=1)
+        with pytest.raises(ValidationError):
+            result.count = 2
+
+    def test_status_keeps_enum_member(self):
+        assert _partition(FlowStatus.SUCCESS).status is FlowStatus.SUCCESS
+
+
+# ---------------------------------------------------------------------------
+# BronzeToSilverResult.from_partitions
+# ---------------------------------------------------------------------------
+class TestFromPartitions:
+    """Tests for aggregating partition results."""
+
+    def test_any_error_marks_flow_as_error(self):
+        results = [_partition(FlowStatus.SUCCESS, 5), _partition(FlowStatus.ERROR)]
+        summary = BronzeToSilverResult.from_partitions(results)
+        assert summary.status == FlowStatus.ERROR
+        assert summary.partitions_ok == 1
+        assert summary.partitions_error == 1
+
+    def test_no_rows_is_completed_no_data(self):
+        summary = BronzeToSilverResult.from_partitions([_partition(FlowStatus.COMPLETED_NO_DATA)])
+        assert summary.status == FlowStatus.COMPLETED_NO_DATA
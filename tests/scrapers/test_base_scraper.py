@@ -1,12 +1,14 @@
 """Unit tests for BaseScraper date filtering logic."""
 
+import threading
 from datetime import UTC, date, datetime, timedelta
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pytest
 
 from real_estate_data_platform.models.enums import City, DateMode
 from real_estate_data_platform.models.listings import RentalsListing
+from real_estate_data_platform.scrapers.base_scraper import BaseScraper
 from real_estate_data_platform.scrapers.kijiji_scraper import KijijiScraper
 
 
@@ -275,7 +277,132 @@ class TestScraperInit:
         assert scraper.specific_date == date(2026, 2, 25)
         scraper.close()
 
+    def test_scraped_at_can_be_injected(self):
+        scraped_at = datetime(2026, 2, 27, 8, 0, tzinfo=UTC)
+        scraper = KijijiScraper(user_agent="TestAgent/1.0", scraped_at=scraped_at)
+        assert scraper.scraped_at == scraped_at
+        scraper.close()
+
     def test_session_has_user_agent(self):
         scraper = KijijiScraper(user_agent="TestAgent/1.0", download_delay=0)
         assert scraper.session.headers["User-Agent"] == "TestAgent/1.0"
         scraper.close()
+
+    def test_session_retries_transient_http_errors(self):
+        scraper = KijijiScraper(user_agent="TestAgent/1.0", download_delay=0)
+        for prefix in ("https://", "http://"):
+            retry = scraper.session.get_adapter(prefix).max_retries
+            assert retry.total == 5
+            assert retry.backoff_factor == 0.5
+            assert set(retry.status_forcelist) == {429, 500, 502, 503, 504}
+            assert retry.raise_on_status is False
+        scraper.close()
+
+    def test_session_pool_sized_for_concurrency(self):
+        scraper = KijijiScraper(user_agent="TestAgent/1.0", download_delay=0, pool_maxsize=16)
+        assert scraper.session.get_adapter("https://")._pool_maxsize == 16
+        scraper.close()
+
+
+# ---------------------------------------------------------------------------
+# _claim_url
+# ---------------------------------------------------------------------------
+class TestClaimUrl:
+    """Tests for the in-run duplicate listing guard."""
+
+    def test_first_claim_wins(self):
+        scraper = KijijiScraper(user_agent="TestAgent/1.0", download_delay=0)
+        assert scraper._claim_url("https://www.kijiji.ca/v-a/1") is True
+        assert scraper._claim_url("https://www.kijiji.ca/v-a/1") is False
+        assert scraper._claim_url("https://www.kijiji.ca/v-a/2") is True
+        scraper.close()
+
+    def test_claim_urls_blocks_later_claims(self):
+        scraper = KijijiScraper(user_agent="TestAgent/1.0", download_delay=0)
+        scraper.claim_urls(["https://www.kijiji.ca/v-a/1", "https://www.kijiji.ca/v-a/2"])
+        assert scraper._claim_url("https://www.kijiji.ca/v-a/1") is False
+        assert scraper._claim_url("https://www.kijiji.ca/v-a/2") is False
+        scraper.close()
+
+    def test_released_url_can_be_claimed_again(self):
+        scraper = KijijiScraper(user_agent="TestAgent/1.0", download_delay=0)
+        scraper._claim_url("https://www.kijiji.ca/v-a/1")
+        scraper._release_url("https://www.kijiji.ca/v-a/1")
+        assert scraper._claim_url("https://www.kijiji.ca/v-a/1") is True
+        scraper.close()
+
+
+# ---------------------------------------------------------------------------
+# _wait_for_request_slot
+# ---------------------------------------------------------------------------
+class TestWaitForRequestSlot:
+    """Tests for the shared politeness throttle."""
+
+    _TIME = "real_estate_data_platform.scrapers.base_scraper.time"
+
+    def test_first_request_does_not_sleep(self):
+        scraper = KijijiScraper(user_agent="TestAgent/1.0", download_delay=2.0)
+        with patch(f"{self._TIME}.sleep") as mock_sleep:
+            scraper._wait_for_request_slot()
+        mock_sleep.assert_not_called()
+        scraper.close()
+
+    def test_sleeps_only_the_remaining_delay(self):
+        scraper = KijijiScraper(user_agent="TestAgent/1.0", download_delay=2.0)
+        with (
+            patch(f"{self._TIME}.monotonic", side_effect=[100.0, 101.5]),
+            patch(f"{self._TIME}.sleep") as mock_sleep,
+            patch(
+                "real_estate_data_platform.scrapers.base_scraper.random.uniform", return_value=1.0
+            ),
+        ):
+            scraper._wait_for_request_slot()  # next slot at 102.0
+            scraper._wait_for_request_slot()  # 1.5s already elapsed
+        mock_sleep.assert_called_once_with(0.5)
+        scraper.close()
+
+    def test_threads_share_one_schedule(self):
+        scraper = KijijiScraper(user_agent="TestAgent/1.0", download_delay=2.0)
+        with (
+            patch(f"{self._TIME}.monotonic", return_value=100.0),
+            patch(f"{self._TIME}.sleep") as mock_sleep,
+            patch(
+                "real_estate_data_platform.scrapers.base_scraper.random.uniform", return_value=1.0
+            ),
+        ):
+            workers = [threading.Thread(target=scraper._wait_for_request_slot) for _ in range(3)]
+            for worker in workers:
+                worker.start()
+            for worker in workers:
+                worker.join()
+        # Starts are reserved at 100, 102 and 104 regardless of which thread asks
+        assert sorted(call.args[0] for call in mock_sleep.call_args_list) == [2.0, 4.0]
+        scraper.close()
+
+    def test_no_delay_never_sleeps(self):
+        scraper = KijijiScraper(user_agent="TestAgent/1.0", download_delay=0)
+        with patch(f"{self._TIME}.sleep") as mock_sleep:
+            scraper._wait_for_request_slot()
+            scraper._wait_for_request_slot()
+        mock_sleep.assert_not_called()
+        scraper.close()
+
+
+# ---------------------------------------------------------------------------
+# Site constants
+# ---------------------------------------------------------------------------
+class TestRequiredClassAttributes:
+    """Tests for the class-definition check of the site constants."""
+
+    def test_missing_constant_fails_at_definition(self):
+        with pytest.raises(TypeError, match="base_url"):
+
+            class _NoBaseUrl(BaseScraper):
+                name_website = "example"
+                supported_cities = {}
+
+    def test_inherited_constants_are_accepted(self):
+        class _KijijiVariant(KijijiScraper):
+            pass
+
+        assert _KijijiVariant.base_url == KijijiScraper.base_url
@@ -1,6 +1,8 @@
 """Unit tests for KijijiScraper."""
 
 import json
+import threading
+from datetime import UTC, datetime, timedelta
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -11,6 +13,11 @@ from real_estate_data_platform.models.listings import RentalsListing
 from real_estate_data_platform.scrapers.kijiji_scraper import ATTRIBUTE_MAPPING, KijijiScraper
 
 
+def _dummy_listing(age_days: int = 0) -> MagicMock:
+    """Stand-in listing published ``age_days`` ago."""
+    return MagicMock(spec=RentalsListing, published_at=datetime.now(UTC) - timedelta(days=age_days))
+
+
 # ---------------------------------------------------------------------------
 # Properties
 # ---------------------------------------------------------------------------
@@ -125,6 +132,11 @@ class TestExtractAttributes:
         attrs = kijiji_scraper._extract_attributes(listing_data)
         assert attrs["bedrooms"] is None
 
+    def test_handles_attribute_with_empty_values(self, kijiji_scraper):
+        listing_data = {"attributes": {"all": [{"name": "Gym", "values": []}]}}
+        attrs = kijiji_scraper._extract_attributes(listing_data)
+        assert attrs == {"gym": None}
+
     def test_all_attribute_mapping_keys_are_strings(self):
         """Ensure ATTRIBUTE_MAPPING is well-formed."""
         for key, value in ATTRIBUTE_MAPPING.items():
@@ -231,6 +243,7 @@ class TestParseListingDetail:
         assert listing.transit_score == 8.5
         assert listing.bike_score == 7.8
         assert len(listing.images) == 2
+        assert listing.scraped_at is kijiji_scraper.scraped_at
 
     def test_parses_listing_without_neighbourhood(
         self, kijiji_scraper, listing_no_neighbourhood_html
@@ -333,7 +346,7 @@ class TestParsePageImpl:
     """Tests for search results page parsing."""
 
     def test_parses_all_listings_from_search_page(self, kijiji_scraper, search_page_soup):
-        dummy_listing = MagicMock(spec=RentalsListing)
+        dummy_listing = _dummy_listing()
 
         with patch.object(kijiji_scraper, "_parse_listing", return_value=dummy_listing):
             listings, failed = kijiji_scraper._parse_page_impl(search_page_soup, City.TORONTO)
@@ -343,7 +356,7 @@ class TestParsePageImpl:
 
     def test_counts_failed_listings(self, kijiji_scraper, search_page_soup):
         # First call succeeds, second and third fail
-        dummy_listing = MagicMock(spec=RentalsListing)
+        dummy_listing = _dummy_listing()
         side_effects = [dummy_listing, None, None]
 
         with patch.object(kijiji_scraper, "_parse_listing", side_effect=side_effects):
@@ -352,6 +365,100 @@ class TestParsePageImpl:
         assert len(listings) == 1
         assert failed == 2
 
+    def test_fetches_listing_details_concurrently(self, search_page_soup):
+        scraper = KijijiScraper(user_agent="TestAgent/1.0", download_delay=0, detail_concurrency=3)
+        # Every detail fetch blocks until all three are in flight at once
+        all_in_flight = threading.Barrier(3, timeout=10)
+
+        def _parse_listing(item, city):
+            all_in_flight.wait()
+            return _dummy_listing()
+
+        with patch.object(scraper, "_parse_listing", side_effect=_parse_listing):
+            listings, failed = scraper._parse_page_impl(search_page_soup, City.TORONTO)
+        scraper.close()
+
+        assert len(listings) == 3
+        assert failed == 0
+
+    def test_detail_threads_are_reused_across_pages(self, kijiji_scraper):
+        threads = []
+
+        def _parse_listing(item, city):
+            threads.append(threading.current_thread())
+            return _dummy_listing()
+
+        with patch.object(kijiji_scraper, "_parse_listing", side_effect=_parse_listing):
+            kijiji_scraper._fetch_listing_details([{}], City.TORONTO)
+            kijiji_scraper._fetch_listing_details([{}], City.TORONTO)
+
+        assert threads[0] is threads[1]
+        assert threads[0].name.startswith("kijiji-detail")
+
+    def test_close_shuts_down_detail_pool(self):
+        scraper = KijijiScraper(user_agent="TestAgent/1.0", download_delay=0)
+        scraper.close()
+        with pytest.raises(RuntimeError):
+            scraper._fetch_listing_details([{}], City.TORONTO)
+
+    def test_stops_after_streak_of_old_listings(self, kijiji_scraper, search_page_soup):
+        # Default LAST_X_DAYS window is 7 days; every organic listing is older
+        old_listing = _dummy_listing(age_days=30)
+
+        with (
+            patch("real_estate_data_platform.scrapers.kijiji_scraper._OLD_LISTING_STREAK_LIMIT", 2),
+            patch.object(kijiji_scraper, "_parse_listing", return_value=old_listing) as parse,
+        ):
+            listings, failed = kijiji_scraper._parse_page_impl(search_page_soup, City.TORONTO)
+
+        assert parse.call_count == 2
+        assert len(listings) == 2
+        assert failed == 0
+
+    def test_recent_listing_resets_old_streak(self, kijiji_scraper, search_page_soup):
+        side_effects = [_dummy_listing(age_days=30), _dummy_listing(), _dummy_listing(age_days=30)]
+
+        with (
+            patch("real_estate_data_platform.scrapers.kijiji_scraper._OLD_LISTING_STREAK_LIMIT", 2),
+            patch.object(kijiji_scraper, "_parse_listing", side_effect=side_effects) as parse,
+        ):
+            kijiji_scraper._parse_page_impl(search_page_soup, City.TORONTO)
+
+        assert parse.call_count == 3
+
+    def test_skips_listings_already_fetched_in_this_run(self, kijiji_scraper, search_page_soup):
+        dummy_listing = _dummy_listing()
+
+        with patch.object(kijiji_scraper, "_parse_listing", return_value=dummy_listing) as parse:
+            kijiji_scraper._parse_page_impl(search_page_soup, City.TORONTO)
+            listings, failed = kijiji_scraper._parse_page_impl(search_page_soup, City.TORONTO)
+
+        assert parse.call_count == 3
+        assert listings == []
+        assert failed == 0
+
+    def test_retry_refetches_failed_listings(self, kijiji_scraper, search_page_soup):
+        with patch.object(kijiji_scraper, "_parse_listing", return_value=None):
+            kijiji_scraper._parse_page_impl(search_page_soup, City.TORONTO)
+        with patch.object(kijiji_scraper, "_parse_listing", return_value=_dummy_listing()) as parse:
+            listings, failed = kijiji_scraper._parse_page_impl(search_page_soup, City.TORONTO)
+
+        assert parse.call_count == 3
+        assert len(listings) == 3
+        assert failed == 0
+
+    def test_retry_fetches_listings_skipped_by_early_exit(self, kijiji_scraper, search_page_soup):
+        with (
+            patch("real_estate_data_platform.scrapers.kijiji_scraper._OLD_LISTING_STREAK_LIMIT", 1),
+            patch.object(kijiji_scraper, "_parse_listing", return_value=_dummy_listing(30)),
+        ):
+            kijiji_scraper._parse_page_impl(search_page_soup, City.TORONTO)
+        with patch.object(kijiji_scraper, "_parse_listing", return_value=_dummy_listing()) as parse:
+            kijiji_scraper._parse_page_impl(search_page_soup, City.TORONTO)
+
+        # Only the first listing was fetched before stopping; the other two are fetched now
+        assert parse.call_count == 2
+
     def test_returns_empty_when_no_json_ld(self, kijiji_scraper, search_empty_soup):
         listings, failed = kijiji_scraper._parse_page_impl(search_empty_soup, City.TORONTO)
         assert listings == []
@@ -408,7 +515,9 @@ class TestGetPage:
     """Tests for get_page HTTP fetching."""
 
     def test_returns_soup_object(self, kijiji_scraper):
-        html = "<html><body><h1>Test</h1></body></html>"
+        html = (
+            '<html><body><h1>Test</h1><script type="application/ld+json">{}</script></body></html>'
+        )
         mock_response = MagicMock()
         mock_response.text = html
         mock_response.raise_for_status = MagicMock()
@@ -417,7 +526,9 @@ class TestGetPage:
             soup = kijiji_scraper.get_page(City.TORONTO, page=1)
 
         assert isinstance(soup, BeautifulSoup)
-        assert soup.find("h1").text == "Test"
+        assert soup.find("script", type="application/ld+json").string == "{}"
+        # Only <script> tags are kept in the parse tree
+        assert soup.find("h1") is None
 
     def test_passes_correct_url_page_1(self, kijiji_scraper):
         mock_response = MagicMock()
@@ -443,6 +554,18 @@ class TestGetPage:
         )
         mock_get.assert_called_once_with(expected_url, timeout=10)
 
+    def test_waits_for_request_slot(self, kijiji_scraper):
+        mock_response = MagicMock()
+        mock_response.text = "<html></html>"
+
+        with (
+            patch.object(kijiji_scraper.session, "get", return_value=mock_response),
+            patch.object(kijiji_scraper, "_wait_for_request_slot") as mock_wait,
+        ):
+            kijiji_scraper.get_page(City.TORONTO)
+
+        mock_wait.assert_called_once_with()
+
     def test_raises_on_http_error(self, kijiji_scraper):
         import requests
 
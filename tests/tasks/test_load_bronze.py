@@ -0,0 +1,134 @@
+"""Tests for real_estate_data_platform.tasks.load_bronze."""
+
+import json
+from datetime import UTC, datetime
+from unittest.mock import MagicMock, patch
+
+import polars as pl
+import pytest
+
+from real_estate_data_platform.models.enums import DateMode
+from real_estate_data_platform.models.listings import RentalsListing
+from real_estate_data_platform.tasks.load_bronze import (
+    _LISTING_SCHEMA,
+    SCRAPE_METADATA_KEY,
+    _polars_dtype,
+    listings_to_dataframe,
+    save_listings_to_minio,
+)
+
+_PATCH_PREFIX = "real_estate_data_platform.tasks.load_bronze"
+
+
+def _listing(**overrides) -> RentalsListing:
+    """Build a minimal valid listing."""
+    base: dict = {
+        "listing_id": "123",
+        "url": "https://kijiji.ca/v/123",
+        "website": "kijiji",
+        "published_at": datetime(2026, 3, 1, 10, tzinfo=UTC),
+        "title": "Nice Condo",
+        "description": "A lovely place",
+        "street": "123 Main St",
+        "city": "toronto",
+    }
+    base.update(overrides)
+    return RentalsListing(**base)
+
+
+# ---------------------------------------------------------------------------
+# _polars_dtype
+# ---------------------------------------------------------------------------
+class TestPolarsDtype:
+    """Tests for mapping model annotations to Polars dtypes."""
+
+    def test_optional_maps_to_inner_type(self):
+        assert _polars_dtype(float | None) == pl.Float64()
+
+    def test_list_of_optional(self):
+        assert _polars_dtype(list[str] | None) == pl.List(pl.String())
+
+    @pytest.mark.parametrize("annotation", [int | str | None, bytes, dict[str, int]])
+    def test_unmappable_annotation_raises_type_error(self, annotation):
+        with pytest.raises(TypeError):
+            _polars_dtype(annotation)
+
+
+# ---------------------------------------------------------------------------
+# listings_to_dataframe
+# ---------------------------------------------------------------------------
+class TestListingsToDataframe:
+    """Tests for the listings → DataFrame conversion."""
+
+    def test_matches_model_dump(self):
+        listings = [
+            _listing(listing_id="1", rent=1500.0, images=["a.jpg", "b.jpg"]),
+            _listing(listing_id="2", city="vancouver", bedrooms=2),
+        ]
+
+        result = listings_to_dataframe.fn(listings)
+
+        assert result.to_dicts() == [listing.model_dump() for listing in listings]
+
+    def test_uses_declared_schema(self):
+        result = listings_to_dataframe.fn([_listing()])
+
+        assert result.columns == list(RentalsListing.model_fields)
+        assert result.schema["city"] == pl.String
+        assert result.schema["published_at"] == pl.Datetime("us", "UTC")
+        assert result.schema["images"] == pl.List(pl.String)
+        # All-null columns keep their declared dtype instead of pl.Null
+        assert result.schema["rent"] == pl.Float64
+        assert result.schema["bedrooms"] == pl.Int64
+        assert result.schema["neighbourhood"] == pl.String
+
+    def test_empty_input_has_full_schema(self):
+        result = listings_to_dataframe.fn([])
+
+        assert result.height == 0
+        assert result.schema == _LISTING_SCHEMA
+
+
+# ---------------------------------------------------------------------------
+# save_listings_to_minio
+# ---------------------------------------------------------------------------
+@patch(f"{_PATCH_PREFIX}.get_run_logger")
+class TestSaveListingsToMinio:
+    """Tests for the bronze Parquet + metadata upload task."""
+
+    @staticmethod
+    def _save(storage: MagicMock, df: pl.DataFrame):
+        return save_listings_to_minio.fn(
+            df=df,
+            storage=storage,
+            source="kijiji",
+            city="toronto",
+            partition_date="2026-03-01",
+            max_pages=5,
+            mode=DateMode.LAST_X_DAYS,
+            days=7,
+        )
+
+    def test_writes_single_object_with_embedded_metadata(self, _mock_logger):
+        storage = MagicMock(bucket_name="raw")
+        df = pl.DataFrame({"listing_id": ["1", "2"]})
+
+        result = self._save(storage, df)
+
+        base_dir = "listings/source=kijiji/city=toronto/dt=2026-03-01"
+        kwargs = storage.save_parquet.call_args.kwargs
+        assert kwargs["dataframe"] is df
+        assert kwargs["object_name"].startswith(f"{base_dir}/part-")
+        metadata = json.loads(kwargs["metadata"][SCRAPE_METADATA_KEY])
+        assert metadata["record_count"] == 2
+        assert metadata["mode"] == "last_x_days"
+        assert metadata["max_pages"] == 5
+        assert result.path == f"raw/{kwargs['object_name']}"
+        assert result.count == 2
+
+    def test_propagates_upload_error(self, _mock_logger):
+        storage = MagicMock(bucket_name="raw")
+        storage.save_parquet.side_effect = RuntimeError("upload failed")
+
+        with pytest.raises(RuntimeError, match="upload failed"):
+            self._save(storage, pl.DataFrame({"listing_id": ["1"]}))
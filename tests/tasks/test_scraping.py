@@ -0,0 +1,102 @@
+"""Unit tests for scraping tasks."""
+
+from datetime import UTC, date, datetime
+from unittest.mock import MagicMock, patch
+
+from prefect import flow
+
+from real_estate_data_platform.models.enums import City, DateMode
+from real_estate_data_platform.models.listings import RentalsListing
+from real_estate_data_platform.scrapers.kijiji_scraper import KijijiScraper
+from real_estate_data_platform.tasks.scraping import _page_cache_key, fetch_and_parse_page
+
+
+def _scraper(**kwargs) -> KijijiScraper:
+    """Build a scraper with a fixed scrape timestamp."""
+    defaults = {
+        "user_agent": "TestAgent/1.0",
+        "download_delay": 0,
+        "scraped_at": datetime(2026, 2, 27, 8, 0, tzinfo=UTC),
+    }
+    defaults.update(kwargs)
+    return KijijiScraper(**defaults)
+
+
+def _listing() -> RentalsListing:
+    """Build a minimal valid listing."""
+    return RentalsListing(
+        listing_id="test-001",
+        url="https://www.kijiji.ca/v-apartments-condos/toronto/test/1",
+        website="kijiji",
+        published_at=datetime.now(UTC),
+        title="Test listing",
+        description="A test listing",
+        street="123 Test St",
+        city=City.TORONTO,
+    )
+
+
+def _key(scraper: KijijiScraper, city: City = City.TORONTO, page: int = 1) -> str:
+    return _page_cache_key(None, {"scraper": scraper, "city": city, "page": page})
+
+
+# ---------------------------------------------------------------------------
+# _page_cache_key
+# ---------------------------------------------------------------------------
+class TestPageCacheKey:
+    """Tests for the fetch_and_parse_page cache key."""
+
+    def test_same_page_same_day_shares_key(self):
+        later = _scraper(scraped_at=datetime(2026, 2, 27, 20, 0, tzinfo=UTC))
+        assert _key(_scraper()) == _key(later)
+
+    def test_key_changes_with_page_and_city(self):
+        scraper = _scraper()
+        keys = {_key(scraper), _key(scraper, page=2), _key(scraper, city=City.VANCOUVER)}
+        assert len(keys) == 3
+
+    def test_key_changes_with_scrape_day(self):
+        next_day = _scraper(scraped_at=datetime(2026, 2, 28, 8, 0, tzinfo=UTC))
+        assert _key(_scraper()) != _key(next_day)
+
+    def test_key_changes_with_date_filter(self):
+        specific = _scraper(scraper_mode=DateMode.SPECIFIC_DATE, specific_date=date(2026, 2, 25))
+        assert _key(_scraper()) != _key(_scraper(days=3))
+        assert _key(_scraper()) != _key(specific)
+
+
+# ---------------------------------------------------------------------------
+# fetch_and_parse_page caching
+# ---------------------------------------------------------------------------
+class TestFetchAndParsePageCache:
+    """Tests for which page results are replayed from the cache."""
+
+    def _run_twice(self, parsed: tuple[list, int]) -> MagicMock:
+        """Run the same page twice in one flow and return the patched get_page."""
+        page = 1
+        scraper = _scraper()
+        task = fetch_and_parse_page.with_options(retries=0)
+
+        @flow
+        def _two_runs():
+            task(scraper, City.TORONTO, page)
+            task(scraper, City.TORONTO, page)
+
+        with (
+            patch.object(KijijiScraper, "get_page") as mock_get_page,
+            patch.object(KijijiScraper, "parse_page", return_value=parsed),
+        ):
+            _two_runs()
+        return mock_get_page
+
+    def test_complete_page_is_served_from_cache(self):
+        mock_get_page = self._run_twice(([_listing()], 0))
+        assert mock_get_page.call_count == 1
+
+    def test_page_with_failed_listings_is_not_cached(self):
+        mock_get_page = self._run_twice(([_listing()], 1))
+        assert mock_get_page.call_count == 2
+
+    def test_empty_page_is_not_cached(self):
+        mock_get_page = self._run_twice(([], 0))
+        assert mock_get_page.call_count == 2
@@ -1,10 +1,16 @@
 """Tests for real_estate_data_platform.utils.dates."""
 
 from datetime import UTC, date, datetime, timedelta
+from unittest.mock import patch
 
 import pytest
 
-from real_estate_data_platform.utils.dates import date_range, format_date, parse_iso_datetime
+from real_estate_data_platform.utils.dates import (
+    date_range,
+    format_date,
+    parse_iso_datetime,
+    utc_now_seconds,
+)
 
 
 # ---------------------------------------------------------------------------
@@ -34,6 +40,26 @@ class TestParseIsoDatetime:
     def test_empty_or_none_returns_none(self, value):
         assert parse_iso_datetime(value) is None
 
+    def test_z_suffix_is_utc(self):
+        assert parse_iso_datetime("2026-02-12T08:03:15Z").tzinfo == UTC
+
+    def test_datetime_passes_through(self):
+        dt = datetime(2026, 2, 12, 8, 3, 15, tzinfo=UTC)
+        assert parse_iso_datetime(dt) is dt
+
+    def test_date_becomes_midnight(self):
+        assert parse_iso_datetime(date(2026, 2, 12)) == datetime(2026, 2, 12)
+
+    def test_non_string_returns_none(self):
+        assert parse_iso_datetime(1700000000) is None
+
+    def test_unhashable_returns_none(self):
+        assert parse_iso_datetime(["2026-02-12"]) is None
+
+    def test_repeated_string_reuses_parsed_value(self):
+        value = "2026-02-12T08:03:15.000Z"
+        assert parse_iso_datetime(value) is parse_iso_datetime(value)
+
     def test_invalid_format_returns_none(self):
         assert parse_iso_datetime("not-a-date") is None
 
@@ -41,6 +67,33 @@ class TestParseIsoDatetime:
         assert parse_iso_datetime("12/31/2026 pizza") is None
 
 
+# ---------------------------------------------------------------------------
+# utc_now_seconds
+# ---------------------------------------------------------------------------
+class TestUtcNowSeconds:
+    """Tests for the per-second cached UTC timestamp."""
+
+    def test_truncated_utc_now(self):
+        before = datetime.now(UTC).replace(microsecond=0)
+        now = utc_now_seconds()
+        after = datetime.now(UTC)
+
+        assert now.tzinfo == UTC
+        assert now.microsecond == 0
+        assert before <= now <= after
+
+    def test_reused_within_same_second(self):
+        with patch("real_estate_data_platform.utils.dates.time.time", return_value=1_772_000_000.2):
+            first = utc_now_seconds()
+        with patch("real_estate_data_platform.utils.dates.time.time", return_value=1_772_000_000.9):
+            second = utc_now_seconds()
+        with patch("real_estate_data_platform.utils.dates.time.time", return_value=1_772_000_001.0):
+            third = utc_now_seconds()
+
+        assert first is second
+        assert third == datetime.fromtimestamp(1_772_000_001, UTC)
+
+
 # ---------------------------------------------------------------------------
 # format_date
 # ---------------------------------------------------------------------------
@@ -0,0 +1,36 @@
+"""Tests for real_estate_data_platform.utils.paths."""
+
+import re
+
+from real_estate_data_platform.utils.paths import bronze_parquet_path, bronze_partition_prefix
+
+
+# ---------------------------------------------------------------------------
+# bronze_partition_prefix
+# ---------------------------------------------------------------------------
+class TestBronzePartitionPrefix:
+    """Tests for the bronze partition prefix."""
+
+    def test_hive_style_prefix(self):
+        assert (
+            bronze_partition_prefix("kijiji", "toronto", "2026-02-27")
+            == "listings/source=kijiji/city=toronto/dt=2026-02-27/"
+        )
+
+
+# ---------------------------------------------------------------------------
+# bronze_parquet_path
+# ---------------------------------------------------------------------------
+class TestBronzeParquetPath:
+    """Tests for the bronze Parquet object path."""
+
+    def test_path_under_partition_prefix(self):
+        path = bronze_parquet_path("kijiji", "toronto", "2026-02-27")
+
+        prefix = bronze_partition_prefix("kijiji", "toronto", "2026-02-27")
+        assert path.startswith(prefix)
+        assert re.fullmatch(r"part-[0-9a-f]{32}\.parquet", path.removeprefix(prefix))
+
+    def test_each_call_gets_a_new_name(self):
+        paths = {bronze_parquet_path("kijiji", "toronto", "2026-02-27") for _ in range(3)}
+        assert len(paths) == 3